@@ -17,193 +17,574 @@ The script produces three CSV files:
 Author: Improved by Manus
 """
 
+import asyncio
+import contextlib
 import csv
 import json
 import logging
+import multiprocessing
+import os
 import re
-from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple, Any
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Any
 
-import requests
+import aiofiles
+import aiohttp
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Maximum number of pooled keep-alive connections to the forum
+CONNECTION_POOL_SIZE = 32
+
+# Maximum number of raw post downloads in flight at once
+MAX_CONCURRENT_FETCHES = 20
+
+# Maximum number of raw post fetches scheduled ahead of the consumer
+FETCH_WINDOW = 2 * MAX_CONCURRENT_FETCHES
+
+# Number of topic listing pages requested speculatively in parallel
+PAGE_PREFETCH_WINDOW = 8
+
+# Directory holding cached raw Markdown, one "{post_id}.md" file per post, plus
+# topic listing pages and their ETags under "pages/"
+CACHE_DIR = Path("cache")
+
+# Environment variable giving the maximum age in seconds of a cached post (unset = never expire)
+CACHE_TTL_ENV = "BULLHORN_CACHE_TTL"
+
+# Keywords that mark a line as a user contribution
+_KEYWORDS = ("shared", "said", "contributed")
+
+# Matches "[user](https://matrix.to/#/@...)" followed by one of the keywords on the same line.
+# Left unanchored so the engine can scan ahead for the literal "[".
+_MATRIX_RE = re.compile(
+    r"\[(.*?)\]\((https://matrix\.to/#/@[^)\n]+)\)[^\n]*("
+    + "|".join(_KEYWORDS)
+    + ")",
+    re.IGNORECASE
 )
+
+# Cheap pre-check for any matrix link, case-insensitive like _MATRIX_RE
+_MATRIX_LINK_RE = re.compile(r"matrix\.to/#/@", re.IGNORECASE)
+
+# Hyperscan database locating the same lines as _MATRIX_RE, used when hyperscan is installed
+_MATRIX_DB = None
+if hyperscan is not None:
+    _MATRIX_DB = hyperscan.Database()
+    _MATRIX_DB.compile(
+        expressions=[(
+            r"^[^\n]*\[[^\n]*\]\(https://matrix\.to/#/@[^)\n]+\)[^\n]*("
+            + "|".join(_KEYWORDS)
+            + ")"
+        ).encode()],
+        ids=[1],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST]
+    )
+
 logger = logging.getLogger(__name__)
 
+# Parse JSON payloads with orjson when installed, falling back to the standard library
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@dataclass(slots=True)
+class Edition:
+    """View and like counts for a single Bullhorn edition."""
+    id: int
+    title: str
+    views: int
+    like_count: int
+
+
+def _open_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session whose connector keeps a bounded pool of keep-alive connections.
+    
+    Returns:
+        A new aiohttp ClientSession, to be used as an async context manager
+    """
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=CONNECTION_POOL_SIZE))
+
 
-def fetch_all_bullhorn_topics() -> Tuple[List[int], List[Dict[str, Any]]]:
+async def _request_topic_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    page: int,
+    etag: Optional[str] = None
+) -> Optional[Tuple[Optional[str], Optional[bytes]]]:
+    """
+    Request a topic listing page, optionally as a conditional GET.
+    
+    Args:
+        session: Shared aiohttp session used for all requests
+        url: URL of the listing page
+        page: The zero-based page number, for logging
+        etag: ETag of the cached copy to send as If-None-Match, if any
+        
+    Returns:
+        Tuple of the response ETag and body (None when the server answered 304 Not Modified),
+        or None if the fetch fails
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+
+    try:
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            response.raise_for_status()
+            body = None if response.status == 304 else await response.read()
+            return response.headers.get("ETag"), body
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Failed to fetch page {page}: {e}")
+        return None
+
+
+async def fetch_topic_page(
+    session: aiohttp.ClientSession,
+    page: int
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch a single page of the Bullhorn topic listing.
+    
+    Pages are cached on disk together with the server's ETag and revalidated with a
+    conditional GET, so unchanged pages come back as 304 Not Modified with no body.
+    If the cached copy turns out to be unusable, the page is fetched unconditionally.
+    
+    Args:
+        session: Shared aiohttp session used for all requests
+        page: The zero-based page number to fetch
+        
+    Returns:
+        List of raw topic dictionaries on the page, or None if the fetch fails
+    """
+    url = f"https://forum.ansible.com/c/news-bullhorn/17/l/latest.json?page={page}"
+    body_path = CACHE_DIR / "pages" / f"{page}.json"
+    etag_path = CACHE_DIR / "pages" / f"{page}.etag"
+    logger.info(f"Fetching page {page}")
+
+    cached_etag = None
+    if body_path.exists() and etag_path.exists():
+        try:
+            async with aiofiles.open(etag_path, encoding="utf-8") as f:
+                cached_etag = (await f.read()).strip() or None
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Ignoring unreadable ETag for page {page}: {e}")
+
+    result = await _request_topic_page(session, url, page, cached_etag)
+    if result is None:
+        return None
+    etag, body = result
+
+    if body is None:
+        try:
+            async with aiofiles.open(body_path, "rb") as f:
+                data = _json_loads(await f.read())
+            logger.info(f"Page {page} not modified, using cached copy")
+            return data.get("topic_list", {}).get("topics", [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unusable cached copy of page {page}: {e}")
+
+        result = await _request_topic_page(session, url, page)
+        if result is None:
+            return None
+        etag, body = result
+        if body is None:
+            logger.error(f"Failed to fetch page {page}: unexpected 304 for unconditional request")
+            return None
+
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old ETag first so an interrupted update never pairs it with a new body
+        etag_path.unlink(missing_ok=True)
+        if etag:
+            await _write_atomic(body_path, body)
+            await _write_atomic(etag_path, etag.encode("utf-8"))
+    except IOError as e:
+        logger.error(f"Failed to cache page {page}: {e}")
+
+    data = _json_loads(body)
+    return data.get("topic_list", {}).get("topics", [])
+
+
+async def fetch_all_bullhorn_topics() -> Tuple[List[int], List[Edition], Dict[int, str]]:
     """
     Fetch all Bullhorn topics from the Ansible forum.
     
-    Iteratively retrieves all topic pages from the Ansible forum's Bullhorn category,
-    extracting topic IDs, titles, view counts, and like counts.
+    Retrieves topic pages from the Ansible forum's Bullhorn category in speculative
+    windows of PAGE_PREFETCH_WINDOW pages, extracting topic IDs, titles, view counts,
+    and like counts. Pages past the first empty (or failed) page are discarded.
     
     Returns:
         Tuple containing:
             - List of topic IDs
-            - List of dictionaries with topic metadata (id, title, views, like_count)
+            - List of Edition records with topic metadata (id, title, views, like_count)
+            - Dictionary mapping topic IDs to titles
     """
     post_ids: List[int] = []
-    views_per_edition: List[Dict[str, Any]] = []
-    page = 0
+    views_per_edition: List[Edition] = []
+    id_to_title: Dict[int, str] = {}
+    next_page = 0
 
-    while True:
-        url = f"https://forum.ansible.com/c/news-bullhorn/17/l/latest.json?page={page}"
-        logger.info(f"Fetching page {page}")
-        
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch page {page}: {e}")
-            break
-
-        data = response.json()
-        topics = data.get("topic_list", {}).get("topics", [])
-
-        if not topics:
-            logger.info(f"No more topics found after page {page}")
-            break
-
-        for topic in topics:
-            topic_id = topic.get("id")
-            title = topic.get("title", "").strip()
-            views = topic.get("views", 0)
-            like_count = topic.get("like_count", 0)
-
-            if topic_id:
-                post_ids.append(topic_id)
-                views_per_edition.append({
-                    "id": topic_id,
-                    "title": title,
-                    "views": views,
-                    "like_count": like_count
-                })
-
-        page += 1
+    async with _open_session() as session:
+        while True:
+            window = range(next_page, next_page + PAGE_PREFETCH_WINDOW)
+            pages = await asyncio.gather(*(fetch_topic_page(session, page) for page in window))
+
+            done = False
+            for page, topics in zip(window, pages):
+                if topics is None:
+                    done = True
+                    break
+
+                if not topics:
+                    logger.info(f"No more topics found after page {page}")
+                    done = True
+                    break
+
+                for topic in topics:
+                    topic_id = topic.get("id")
+                    title = topic.get("title", "").strip()
+                    views = topic.get("views", 0)
+                    like_count = topic.get("like_count", 0)
+
+                    if topic_id:
+                        post_ids.append(topic_id)
+                        views_per_edition.append(Edition(topic_id, title, views, like_count))
+                        id_to_title[topic_id] = title
+
+            if done:
+                break
+
+            next_page += PAGE_PREFETCH_WINDOW
 
     logger.info(f"Retrieved {len(post_ids)} topics in total")
-    return post_ids, views_per_edition
+    return post_ids, views_per_edition, id_to_title
 
 
-def fetch_raw_markdown(post_id: int) -> str:
+def _cache_path(post_id: int) -> Path:
     """
-    Fetch raw Markdown content for a specific post.
+    Get the on-disk cache location for a post's raw Markdown.
     
     Args:
+        post_id: The ID of the post
+        
+    Returns:
+        Path of the cache file for the post
+    """
+    return CACHE_DIR / f"{post_id}.md"
+
+
+def _read_cache_ttl() -> Optional[float]:
+    """
+    Read the maximum age of cached posts from the BULLHORN_CACHE_TTL environment variable.
+    
+    Returns:
+        The TTL in seconds, or None if the variable is unset or invalid (cached posts never expire)
+    """
+    ttl = os.environ.get(CACHE_TTL_ENV)
+    if not ttl:
+        return None
+
+    try:
+        return float(ttl)
+    except ValueError:
+        logger.error(f"Ignoring {CACHE_TTL_ENV}={ttl!r}: expected a number of seconds")
+        return None
+
+
+def _is_cache_fresh(path: Path, cache_ttl: Optional[float]) -> bool:
+    """
+    Check whether a cached post can be used instead of fetching it again.
+    
+    Args:
+        path: Path of the cache file
+        cache_ttl: Maximum age of the file in seconds, or None for no expiry
+        
+    Returns:
+        True if the file exists, is non-empty and is newer than cache_ttl (when set)
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+
+    if stat.st_size == 0:
+        return False
+
+    return cache_ttl is None or time.time() - stat.st_mtime < cache_ttl
+
+
+async def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file via a temporary sibling and rename it into place.
+    
+    Readers therefore see either the old or the new contents, never a partial write.
+    
+    Args:
+        path: Destination path
+        data: Bytes to write
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    async with aiofiles.open(tmp_path, "wb") as f:
+        await f.write(data)
+    os.replace(tmp_path, path)
+
+
+async def fetch_raw_markdown_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    post_id: int,
+    cache_ttl: Optional[float] = None
+) -> Tuple[int, str]:
+    """
+    Fetch raw Markdown content for a specific post without blocking the event loop,
+    using the on-disk cache when possible.
+    
+    Args:
+        session: Shared aiohttp session used for all requests
+        sem: Semaphore bounding the number of concurrent requests
         post_id: The ID of the post to fetch
+        cache_ttl: Maximum age in seconds of a usable cached post, or None for no expiry
         
     Returns:
-        The raw Markdown content of the post as a string, or an empty string if the fetch fails
+        Tuple of the post ID and its raw Markdown content, or an empty string if the fetch fails
     """
+    path = _cache_path(post_id)
+    if _is_cache_fresh(path, cache_ttl):
+        try:
+            async with aiofiles.open(path, encoding="utf-8") as f:
+                text = await f.read()
+            logger.info(f"Using cached content for post {post_id}")
+            return post_id, text
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache for post {post_id}: {e}")
+
     url = f"https://forum.ansible.com/raw/{post_id}"
-    logger.info(f"Fetching raw content for post {post_id}")
     
+    async with sem:
+        logger.info(f"Fetching raw content for post {post_id}")
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                text = await response.text(errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch post {post_id}: {e}")
+            return post_id, ""
+
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch post {post_id}: {e}")
-        return ""
-
-
-def extract_user_and_link(
-    post_id: int, 
-    markdown_text: str, 
-    keywords: Tuple[str, ...] = ("shared", "said", "contributed")
-) -> List[Dict[str, str]]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await _write_atomic(path, text.encode("utf-8"))
+    except IOError as e:
+        logger.error(f"Failed to cache post {post_id}: {e}")
+    return post_id, text
+
+
+async def fetch_all_raw(
+    post_ids: List[int],
+    cache_ttl: Optional[float] = None
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Fetch raw Markdown content for all posts concurrently.
+    
+    Up to FETCH_WINDOW downloads are scheduled ahead of the caller; results are yielded
+    in post order as soon as each one is ready, so callers can process a post while
+    later ones are still in flight without every post body being held in memory at once.
+    
+    Args:
+        post_ids: List of post IDs to fetch
+        cache_ttl: Maximum age in seconds of a usable cached post, or None for no expiry
+        
+    Yields:
+        (post_id, markdown) tuples in the same order as post_ids
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    remaining = iter(post_ids)
+    tasks: deque = deque()
+
+    async with _open_session() as session:
+        def schedule() -> None:
+            # Top the window up so it never runs more than FETCH_WINDOW posts ahead
+            for pid in remaining:
+                tasks.append(asyncio.create_task(
+                    fetch_raw_markdown_async(session, sem, pid, cache_ttl)
+                ))
+                if len(tasks) >= FETCH_WINDOW:
+                    break
+
+        try:
+            schedule()
+            while tasks:
+                result = await tasks.popleft()
+                schedule()
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def _scan_with_hyperscan(markdown_text: str) -> Iterator["re.Match[str]"]:
+    """
+    Find matrix-link contribution lines using the compiled Hyperscan database.
+    
+    Hyperscan reports every end offset of a match but no capture groups, so the
+    longest hit per line is re-run through _MATRIX_RE to split out user and link.
+    
+    Args:
+        markdown_text: The raw Markdown content to search
+        
+    Returns:
+        Iterator of _MATRIX_RE matches, in document order
+    """
+    data = markdown_text.encode("utf-8")
+    line_ends: Dict[int, int] = {}
+
+    def on_match(expr_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        if end > line_ends.get(start, -1):
+            line_ends[start] = end
+
+    _MATRIX_DB.scan(data, match_event_handler=on_match)
+
+    for start in sorted(line_ends):
+        match = _MATRIX_RE.search(data[start:line_ends[start]].decode("utf-8"))
+        if match:
+            yield match
+
+
+def extract_user_and_link(post_id: int, markdown_text: str) -> List[Dict[str, str]]:
     """
     Extract user names and matrix links from Markdown text.
     
-    Searches for lines containing user mentions with matrix links followed by specified keywords,
-    which indicate user contributions.
+    Searches for lines containing user mentions with matrix links followed by one of
+    the contribution keywords in _KEYWORDS.
     
     Args:
         post_id: The ID of the post being processed
         markdown_text: The raw Markdown content to search
-        keywords: Tuple of keywords that indicate user contributions
         
     Returns:
-        List of dictionaries containing post_id, user name, and matrix link
+        List of dictionaries containing post_id, stripped user name, and matrix link
     """
-    pattern = r"\[(.*?)\]\((https://matrix\.to/#/@[^)]+)\).*(" + "|".join(keywords) + ")"
+    # Posts without any matrix link cannot match, so skip the scan entirely
+    if not _MATRIX_LINK_RE.search(markdown_text):
+        return []
+
+    # Patterns treat only "\n" as a line break, so normalise every break splitlines() knows
+    markdown_text = "\n".join(markdown_text.splitlines())
+
     matches = []
 
-    for line in markdown_text.splitlines():
-        match = re.search(pattern, line, re.IGNORECASE)
-        if match:
-            user, link, _ = match.groups()
-            matches.append({
-                "post_id": post_id,
-                "user": user,
-                "matrix_link": link
-            })
+    if _MATRIX_DB is not None:
+        found = _scan_with_hyperscan(markdown_text)
+    else:
+        found = _MATRIX_RE.finditer(markdown_text)
+
+    for match in found:
+        user, link, _ = match.groups()
+        matches.append({
+            "post_id": post_id,
+            "user": user.strip(),
+            "matrix_link": link
+        })
 
     return matches
 
 
-def save_to_csv(filename: str, data: List[Dict[str, Any]], fieldnames: List[str]) -> None:
+def save_to_csv(filename: str, data: List[Sequence[Any]], fieldnames: List[str]) -> None:
     """
     Save data to a CSV file.
     
     Args:
         filename: The name of the CSV file to create
-        data: List of dictionaries containing the data to save
+        data: List of rows, each a sequence of values in the same order as fieldnames
         fieldnames: List of column names for the CSV
     """
     try:
         with open(filename, "w", newline='', encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for entry in data:
-                writer.writerow(entry)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(data)
         logger.info(f"Successfully saved {len(data)} rows to {filename}")
     except IOError as e:
         logger.error(f"Failed to write to {filename}: {e}")
 
 
-def count_users_per_post(filtered_data: List[Dict[str, Any]]) -> Dict[int, Set[str]]:
+async def collect_contributions(
+    post_ids: List[int],
+    id_to_title: Dict[int, str],
+    writer: Optional[Any],
+    cache_ttl: Optional[float] = None
+) -> Tuple[Dict[int, Set[str]], Counter, int]:
     """
-    Count unique users per post.
+    Stream user contributions from all posts to a CSV writer while aggregating them.
+    
+    Extraction runs in a process pool as each post is downloaded, and each post's
+    matches are written (in post order) as soon as they are ready, while the
+    remaining downloads continue in the background.
     
     Args:
-        filtered_data: List of dictionaries containing post_id and user information
+        post_ids: List of post IDs to process
+        id_to_title: Dictionary mapping post IDs to titles
+        writer: csv.writer receiving post_id, title, user, matrix_link rows, or None to
+            only aggregate
+        cache_ttl: Maximum age in seconds of a usable cached post, or None for no expiry
         
     Returns:
-        Dictionary mapping post_id to sets of unique users
+        Tuple containing:
+            - Dictionary mapping post_id to sets of unique users
+            - Counter mapping usernames to their contribution counts
+            - Number of rows written
     """
-    user_map: Dict[int, Set[str]] = defaultdict(set)
-    
-    for row in filtered_data:
-        post_id = row["post_id"]
-        user = row["user"]
-        user_map[post_id].add(user)
-        
-    return user_map
+    user_map: Dict[int, Set[str]] = {}
+    user_contributions: Counter = Counter()
+    line_count = 0
 
+    def record(pid: int, matches: List[Dict[str, str]]) -> None:
+        nonlocal line_count, writer
+        title = id_to_title.get(pid, "")
+        users: Set[str] = set()
+        for match in matches:
+            user = match["user"]
+            if writer is not None:
+                try:
+                    writer.writerow([pid, title, user, match["matrix_link"]])
+                except IOError as e:
+                    logger.error(f"Failed to write filtered lines, continuing without them: {e}")
+                    writer = None
+            users.add(user)
+            user_contributions[user] += 1
+            line_count += 1
 
-def count_contributions_per_user(filtered_data: List[Dict[str, Any]]) -> Dict[str, int]:
-    """
-    Count total contributions per user across all posts.
-    
-    Args:
-        filtered_data: List of dictionaries containing user contribution data
-        
-    Returns:
-        Dictionary mapping usernames to their contribution counts
-    """
-    user_contributions: Dict[str, int] = defaultdict(int)
-    
-    for row in filtered_data:
-        user = row["user"].strip()
-        user_contributions[user] += 1
-        
-    return user_contributions
+        if users:
+            user_map[pid] = users
+
+    loop = asyncio.get_running_loop()
+    pending: deque = deque()
+
+    # Workers start lazily while the event loop's threads are running, so never fork
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+        async for pid, raw_md in fetch_all_raw(post_ids, cache_ttl):
+            pending.append((pid, loop.run_in_executor(pool, extract_user_and_link, pid, raw_md)))
+
+            # Record finished extractions in post order without waiting on the rest
+            while pending and pending[0][1].done():
+                done_pid, future = pending.popleft()
+                record(done_pid, future.result())
+
+        while pending:
+            done_pid, future = pending.popleft()
+            record(done_pid, await future)
+
+    return user_map, user_contributions, line_count
 
 
 def main() -> None:
@@ -213,61 +594,47 @@ def main() -> None:
     Executes the following steps:
     1. Fetch all Bullhorn topics
     2. Save view and like counts per edition
-    3. Extract user contributions with matrix links
+    3. Stream user contributions with matrix links to CSV as posts download, tallying
+       users per post and contributions per user in the same pass
     4. Generate statistics on users per post
     5. Generate statistics on contributions per user
     """
+    cache_ttl = _read_cache_ttl()
+    
     # Step 1: Fetch all topic info
-    post_ids, views_per_edition = fetch_all_bullhorn_topics()
+    post_ids, views_per_edition, id_to_title = asyncio.run(fetch_all_bullhorn_topics())
     
     # Step 2: Save views_per_edition to CSV
     save_to_csv(
         "views_per_edition.csv", 
-        views_per_edition, 
+        [(e.id, e.title, e.views, e.like_count) for e in views_per_edition], 
         ["id", "title", "views", "like_count"]
     )
     
-    # Step 3: Collect and save filtered user + matrix links
-    filtered_data = []
-    for pid in post_ids:
-        raw_md = fetch_raw_markdown(pid)
-        user_link_matches = extract_user_and_link(pid, raw_md)
-        filtered_data.extend(user_link_matches)
-    
-    # Create mapping from post_id to title
-    id_to_title = {entry["id"]: entry["title"] for entry in views_per_edition}
-    
-    # Prepare enriched data with titles
-    enriched_data = []
-    for row in filtered_data:
-        post_id = int(row["post_id"])
-        enriched_data.append({
-            "post_id": post_id,
-            "title": id_to_title.get(post_id, ""),
-            "user": row["user"],
-            "matrix_link": row["matrix_link"]
-        })
-    
-    # Save enriched data to CSV
-    save_to_csv(
-        "bullhorn_filtered_lines.csv", 
-        enriched_data, 
-        ["post_id", "title", "user", "matrix_link"]
-    )
-    
-    logger.info(f"Extracted {len(filtered_data)} matching lines to bullhorn_filtered_lines.csv")
+    # Step 3: Stream filtered user + matrix links to CSV, counting users per post and
+    # contributions per user in the same pass. If the file cannot be written, the
+    # aggregates are still collected for the remaining reports.
+    filtered_file = None
+    try:
+        filtered_file = open("bullhorn_filtered_lines.csv", "w", newline='', encoding="utf-8")
+        writer = csv.writer(filtered_file)
+        writer.writerow(["post_id", "title", "user", "matrix_link"])
+    except IOError as e:
+        logger.error(f"Failed to write to bullhorn_filtered_lines.csv: {e}")
+        writer = None
+
+    with filtered_file or contextlib.nullcontext():
+        user_map, user_contributions, line_count = asyncio.run(
+            collect_contributions(post_ids, id_to_title, writer, cache_ttl)
+        )
     
-    # Step 4: Count number of unique users per post_id
-    user_map = count_users_per_post(filtered_data)
+    logger.info(f"Extracted {line_count} matching lines to bullhorn_filtered_lines.csv")
     
-    # Prepare user count data with titles
-    user_count_data = []
-    for pid, users in user_map.items():
-        user_count_data.append({
-            "id": pid,
-            "title": id_to_title.get(pid, ""),
-            "number_of_users": len(users)
-        })
+    # Step 4: Prepare unique user counts per post_id with titles
+    user_count_data = [
+        (pid, id_to_title.get(pid, ""), len(users))
+        for pid, users in user_map.items()
+    ]
     
     # Save user count data to CSV
     save_to_csv(
@@ -278,14 +645,8 @@ def main() -> None:
     
     logger.info(f"Created user_count_per_post.csv with {len(user_map)} rows")
     
-    # Step 5: Count contributions per user
-    user_contributions = count_contributions_per_user(filtered_data)
-    
-    # Prepare user contributions data
-    contributions_data = [
-        {"user": user, "contributions": count}
-        for user, count in sorted(user_contributions.items(), key=lambda x: x[1], reverse=True)
-    ]
+    # Step 5: Prepare contributions per user
+    contributions_data = user_contributions.most_common()
     
     # Save user contributions to CSV
     save_to_csv(
@@ -298,4 +659,10 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, so importing the module has no side effects
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
     main()